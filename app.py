@@ -9,25 +9,79 @@ Features:
 - Graceful error handling for invalid inputs
 """
 
+import asyncio
+import functools
 import os
-from flask import Flask, request, Response, render_template, jsonify, url_for
-from plivo import plivoxml
-import plivo
+import re
+import types
+import uuid
+from typing import NamedTuple
+from xml.sax.saxutils import escape, quoteattr
+from quart import Quart, request, Response
+import httpx
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-app = Flask(__name__)
+app = Quart(__name__)
+
+# Templates never change at runtime; skip the per-render freshness checks
+app.config['TEMPLATES_AUTO_RELOAD'] = False
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-PLIVO_AUTH_ID = os.getenv('PLIVO_AUTH_ID')
-PLIVO_AUTH_TOKEN = os.getenv('PLIVO_AUTH_TOKEN')
-PLIVO_PHONE_NUMBER = os.getenv('PLIVO_PHONE_NUMBER', '+14692463990')
-ASSOCIATE_NUMBER = os.getenv('ASSOCIATE_NUMBER', '+918031274121')
+# Environment is read once here; nothing reads os.environ per request
+CFG = types.SimpleNamespace(
+    auth_id=os.getenv('PLIVO_AUTH_ID'),
+    auth_token=os.getenv('PLIVO_AUTH_TOKEN'),
+    plivo_phone=os.getenv('PLIVO_PHONE_NUMBER', '+14692463990'),
+    associate=os.getenv('ASSOCIATE_NUMBER', '+918031274121'),
+    # Public base URL for Plivo callbacks (e.g. your ngrok or production domain).
+    # If unset, each request's own host is used and never shared across callers.
+    base_url=os.getenv('BASE_URL'),
+    # Call outcomes (job id -> Plivo request_uuid) are logged at INFO
+    log_level=os.getenv('LOG_LEVEL', 'INFO').upper()
+)
+
+# Quart's logger otherwise inherits the root WARNING level outside debug mode
+app.logger.setLevel(CFG.log_level)
+
+# Seconds to wait on any single Plivo API request
+PLIVO_TIMEOUT = 10.0
+
+# Shared async HTTP/2 client for the Plivo REST API. Concurrent calls are
+# multiplexed over one pooled connection instead of one TLS session each.
+PLIVO_CLIENT = (
+    httpx.AsyncClient(
+        http2=True,
+        auth=(CFG.auth_id, CFG.auth_token),
+        base_url=f'https://api.plivo.com/v1/Account/{CFG.auth_id}/',
+        timeout=PLIVO_TIMEOUT
+    )
+    if CFG.auth_id and CFG.auth_token else None
+)
+
+# Bulk dial limits: numbers accepted per request, and Plivo requests in flight
+# per worker process (the total cap is MAX_CONCURRENT_CALLS x worker count)
+MAX_BULK_TARGETS = 100
+MAX_CONCURRENT_CALLS = 20
+_CALL_SLOTS = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+
+# On shutdown Quart waits this long for queued calls, then cancels the rest.
+# Cover a full bulk dial draining through the slots at the request timeout.
+app.config['BACKGROUND_TASK_SHUTDOWN_TIMEOUT'] = (
+    -(-MAX_BULK_TARGETS // MAX_CONCURRENT_CALLS) * PLIVO_TIMEOUT + 5
+)
+
+# IVR callback paths, joined onto the base URL
+WELCOME_PATH = '/ivr/welcome'
+LANGUAGE_HANDLER_PATH = '/ivr/language-handler'
+MAIN_MENU_PATH = '/ivr/main-menu/{lang}'
+MENU_HANDLER_PATH = '/ivr/menu-handler/{lang}'
 
 # Public audio files for demo (you can replace with your own)
 AUDIO_FILES = {
@@ -35,61 +89,218 @@ AUDIO_FILES = {
     'spanish': 'https://s3.amazonaws.com/plivocloud/Trumpet.mp3'
 }
 
+# Supported IVR languages
+VALID_LANGS = frozenset(('english', 'spanish'))
+
+# Level 1 digit -> IVR language
+LANGUAGE_DIGITS = {'1': 'english', '2': 'spanish'}
+
+# Text-to-speech (voice, language) per IVR language
+VOICE_CONFIG = {
+    'english': ('Polly.Joanna', 'en-US'),
+    'spanish': ('Polly.Conchita', 'es-ES')
+}
+
+# E.164 phone number (leading + optional), checked before any Plivo round trip
+_E164_RE = re.compile(r'^\+?[1-9]\d{7,14}$')
+
+# Single-digit Digits field in a Plivo urlencoded webhook body
+_DIGITS_RE = re.compile(r'(?:^|&)Digits=(\d)(?:&|$)')
+
 # =============================================================================
 # MESSAGES
 # =============================================================================
 
-MESSAGES = {
-    'welcome': {
-        'english': "Welcome to InspireWorks. ",
-        'spanish': "Bienvenido a InspireWorks. "
-    },
-    'language_select': (
-        "Press 1 for English. "
-        "Para Español, oprima 2. "
+class _Lang(NamedTuple):
+    """IVR prompts for one language"""
+    welcome: str
+    main_menu: str
+    playing_audio: str
+    connecting: str
+    invalid_input: str
+    no_input: str
+    goodbye: str
+
+
+EN = _Lang(
+    welcome="Welcome to InspireWorks. ",
+    main_menu=(
+        "You have selected English. "
+        "Press 1 to hear a short audio message. "
+        "Press 2 to speak with a live associate. "
     ),
-    'main_menu': {
-        'english': (
-            "You have selected English. "
-            "Press 1 to hear a short audio message. "
-            "Press 2 to speak with a live associate. "
-        ),
-        'spanish': (
-            "Ha seleccionado Español. "
-            "Oprima 1 para escuchar un mensaje de audio. "
-            "Oprima 2 para hablar con un asociado. "
-        )
-    },
-    'playing_audio': {
-        'english': "Now playing your audio message.",
-        'spanish': "Reproduciendo su mensaje de audio."
-    },
-    'connecting': {
-        'english': "Please wait while we connect you to a live associate.",
-        'spanish': "Por favor espere mientras lo conectamos con un asociado."
-    },
-    'invalid_input': {
-        'english': "Sorry, that is not a valid option. Please try again.",
-        'spanish': "Lo siento, esa no es una opción válida. Por favor intente de nuevo."
-    },
-    'no_input': {
-        'english': "We did not receive any input.",
-        'spanish': "No recibimos ninguna entrada."
-    },
-    'goodbye': {
-        'english': "Thank you for calling InspireWorks. Goodbye!",
-        'spanish': "Gracias por llamar a InspireWorks. ¡Adiós!"
-    }
+    playing_audio="Now playing your audio message.",
+    connecting="Please wait while we connect you to a live associate.",
+    invalid_input="Sorry, that is not a valid option. Please try again.",
+    no_input="We did not receive any input.",
+    goodbye="Thank you for calling InspireWorks. Goodbye!"
+)
+
+ES = _Lang(
+    welcome="Bienvenido a InspireWorks. ",
+    main_menu=(
+        "Ha seleccionado Español. "
+        "Oprima 1 para escuchar un mensaje de audio. "
+        "Oprima 2 para hablar con un asociado. "
+    ),
+    playing_audio="Reproduciendo su mensaje de audio.",
+    connecting="Por favor espere mientras lo conectamos con un asociado.",
+    invalid_input="Lo siento, esa no es una opción válida. Por favor intente de nuevo.",
+    no_input="No recibimos ninguna entrada.",
+    goodbye="Gracias por llamar a InspireWorks. ¡Adiós!"
+)
+
+LANGS = {'english': EN, 'spanish': ES}
+
+# Language selection prompt (bilingual)
+LANGUAGE_SELECT = (
+    "Press 1 for English. "
+    "Para Español, oprima 2. "
+)
+
+# Composite prompts, joined once rather than per call
+WELCOME_FULL = {
+    lang: LANGS[lang].welcome + LANGUAGE_SELECT
+    for lang in VALID_LANGS
+}
+FAREWELL = {
+    lang: LANGS[lang].no_input + " " + LANGS[lang].goodbye
+    for lang in VALID_LANGS
 }
 
+# =============================================================================
+# PRECOMPUTED XML RESPONSES
+# =============================================================================
+
+# Every response is a fixed XML document except for (at most) one callback
+# URL, so they are rendered once at import time as bytes with a placeholder
+# that is substituted when serving them.
+URL_PLACEHOLDER = '{{URL}}'
+
+
+def _speak(content, voice, voice_lang):
+    """Render a Speak element"""
+    return (
+        f'<Speak voice={quoteattr(voice)} language={quoteattr(voice_lang)}>'
+        f'{escape(content)}</Speak>'
+    )
+
+
+def _build_xml(*elements):
+    """Wrap elements in a Response document and encode it"""
+    return ('<Response>' + ''.join(elements) + '</Response>').encode('utf-8')
+
+
+def _build_menu_xml(prompt, fallback, voice, voice_lang):
+    """Render a GetDigits menu with a placeholder action URL"""
+    return _build_xml(
+        '<GetDigits action="' + URL_PLACEHOLDER + '" method="POST" '
+        'timeout="10" numDigits="1" retries="2" validDigits="12">',
+        _speak(prompt, voice, voice_lang),
+        '</GetDigits>',
+        # Fallback if no input received
+        _speak(fallback, voice, voice_lang),
+        '<Hangup/>'
+    )
+
+
+def _build_redirect(url):
+    """Render a GET Redirect element"""
+    return f'<Redirect method="GET">{escape(url)}</Redirect>'
+
+
+PRECOMPUTED_XML = {
+    ('welcome', 'english'): _build_menu_xml(
+        WELCOME_FULL['english'],
+        FAREWELL['english'],
+        *VOICE_CONFIG['english']
+    )
+}
+
+for _lang in VALID_LANGS:
+    _msg = LANGS[_lang]
+    _voice, _voice_lang = VOICE_CONFIG[_lang]
+    
+    PRECOMPUTED_XML[('main_menu', _lang)] = _build_menu_xml(
+        _msg.main_menu,
+        FAREWELL[_lang],
+        _voice,
+        _voice_lang
+    )
+    PRECOMPUTED_XML[('play_audio', _lang)] = _build_xml(
+        _speak(_msg.playing_audio, _voice, _voice_lang),
+        f'<Play>{escape(AUDIO_FILES[_lang])}</Play>',
+        _speak(_msg.goodbye, _voice, _voice_lang),
+        '<Hangup/>'
+    )
+    PRECOMPUTED_XML[('connect_associate', _lang)] = _build_xml(
+        _speak(_msg.connecting, _voice, _voice_lang),
+        # Dial the associate number
+        f'<Dial callerId={quoteattr(CFG.plivo_phone)} timeout="30">'
+        f'<Number>{escape(CFG.associate)}</Number></Dial>',
+        # If call fails or ends
+        _speak(_msg.goodbye, _voice, _voice_lang),
+        '<Hangup/>'
+    )
+    PRECOMPUTED_XML[('invalid_input', _lang)] = _build_xml(
+        _speak(_msg.invalid_input, _voice, _voice_lang),
+        _build_redirect(URL_PLACEHOLDER)
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _base_url(url_root):
+    """Return the public base URL for callbacks on a request to url_root"""
+    return CFG.base_url or url_root.rstrip('/')
+
+
+def _callback_url(path, **params):
+    """Build an absolute IVR callback URL for the current request"""
+    return _base_url(request.url_root) + path.format(**params)
+
+
+def _xml_response(key, url=None):
+    """Serve a precomputed XML response, filling in its callback URL"""
+    xml = PRECOMPUTED_XML[key]
+    if url is not None:
+        xml = xml.replace(
+            URL_PLACEHOLDER.encode('utf-8'),
+            escape(url, {'"': '&quot;'}).encode('utf-8')
+        )
+    return Response(xml, mimetype='text/xml')
+
+
+async def _read_digits():
+    """Read the Digits field from the webhook body without full form parsing"""
+    body = await request.get_data(as_text=True)
+    match = _DIGITS_RE.search(body)
+    return match.group(1) if match else ''
+
+
+def _json(obj, status=200):
+    """Serialize a JSON response with orjson"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+
 # =============================================================================
 # FRONTEND ROUTE
 # =============================================================================
 
+# The frontend page is static, so it is rendered once when the server starts
+_INDEX_HTML = None
+
+
+@app.before_serving
+async def _render_index():
+    """Render the frontend page once at startup"""
+    global _INDEX_HTML
+    _INDEX_HTML = await app.jinja_env.get_template('index.html').render_async()
+
+
 @app.route('/')
-def index():
-    """Render the frontend page to trigger outbound calls"""
-    return render_template('index.html')
+async def index():
+    """Serve the frontend page to trigger outbound calls"""
+    return Response(_INDEX_HTML, mimetype='text/html')
 
 
 # =============================================================================
@@ -97,51 +308,141 @@ def index():
 # =============================================================================
 
 @app.route('/make-call', methods=['POST'])
-def make_call():
+async def make_call():
     """
-    Initiate an outbound call to the target phone number.
-    The call will be answered with the IVR welcome menu.
+    Queue outbound calls to one number (`target_number`) or many
+    (`target_numbers`). Each call is answered with the IVR welcome menu.
+    Returns 202 with job ids; the Plivo requests run in the background.
     """
     try:
-        # Get target number from request
-        data = request.get_json()
-        target_number = data.get('target_number')
+        data = await request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return _json({'success': False, 'error': 'Request body must be a JSON object'}, 400)
         
-        if not target_number:
-            return jsonify({'success': False, 'error': 'Target number is required'}), 400
+        target_numbers = data.get('target_numbers')
+        if target_numbers is not None:
+            # Bulk dial: validate every number and report per-target status
+            if not isinstance(target_numbers, list) or not target_numbers:
+                return _json({'success': False, 'error': 'target_numbers must be a non-empty list'}, 400)
+            if len(target_numbers) > MAX_BULK_TARGETS:
+                return _json({'success': False, 'error': f'target_numbers is limited to {MAX_BULK_TARGETS} numbers'}, 400)
+            
+            calls = []
+            seen = set()
+            for target in target_numbers:
+                if not target:
+                    calls.append({'target': target, 'status': 'error', 'error': 'Target number is required'})
+                    continue
+                target_number = _format_number(target)
+                if target_number is None:
+                    calls.append({'target': target, 'status': 'error', 'error': 'Invalid E.164 number'})
+                    continue
+                # Dial each number once, even if it is listed several times
+                if target_number in seen:
+                    calls.append({'target': target_number, 'status': 'error', 'error': 'Duplicate target number'})
+                    continue
+                seen.add(target_number)
+                calls.append({'target': target_number, 'status': 'queued'})
+            
+            if not seen:
+                return _json({
+                    'success': False,
+                    'queued': False,
+                    'error': 'No valid target numbers',
+                    'calls': calls
+                }, 400)
+        else:
+            # Single dial
+            target_number = data.get('target_number')
+            
+            if not target_number:
+                return _json({'success': False, 'error': 'Target number is required'}, 400)
+            
+            target_number = _format_number(target_number)
+            if target_number is None:
+                return _json({'success': False, 'error': 'Invalid E.164 number'}, 400)
         
-        # Format number (ensure it has + prefix)
-        if not target_number.startswith('+'):
-            target_number = '+' + target_number
+        if PLIVO_CLIENT is None:
+            return _json({'success': False, 'error': 'Plivo credentials are not configured'}, 500)
         
-        # Initialize Plivo client
-        client = plivo.RestClient(PLIVO_AUTH_ID, PLIVO_AUTH_TOKEN)
+        # Plivo fetches the IVR welcome menu when the call connects
+        answer_url = _callback_url(WELCOME_PATH)
         
-        # Get the base URL for callbacks
-        # In production, replace with your actual domain
-        base_url = os.getenv('BASE_URL', request.url_root.rstrip('/'))
-        answer_url = f"{base_url}/ivr/welcome"
+        if target_numbers is None:
+            return _json({
+                'success': True,
+                'queued': True,
+                'message': f'Call queued to {target_number}',
+                'job_id': _queue_call(target_number, answer_url)
+            }, 202)
         
-        # Make the outbound call
-        response = client.calls.create(
-            from_=PLIVO_PHONE_NUMBER,
-            to_=target_number,
-            answer_url=answer_url,
-            answer_method='GET'
-        )
+        for call in calls:
+            if call['status'] == 'queued':
+                call['job_id'] = _queue_call(call['target'], answer_url)
         
-        return jsonify({
-            'success': True,
-            'message': f'Call initiated to {target_number}',
-            'call_uuid': response.request_uuid
-        })
+        return _json({'success': True, 'queued': True, 'calls': calls}, 202)
         
-    except plivo.exceptions.ValidationError as e:
-        return jsonify({'success': False, 'error': f'Validation error: {str(e)}'}), 400
-    except plivo.exceptions.PlivoRestError as e:
-        return jsonify({'success': False, 'error': f'Plivo API error: {str(e)}'}), 500
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        return _json({'success': False, 'error': str(e)}, 500)
+
+
+def _format_number(target_number):
+    """Normalize a phone number to E.164 with a + prefix; None if invalid"""
+    if not isinstance(target_number, str):
+        return None
+    
+    target_number = target_number.strip()
+    if not _E164_RE.match(target_number):
+        return None
+    
+    if not target_number.startswith('+'):
+        target_number = '+' + target_number
+    return target_number
+
+
+def _queue_call(target_number, answer_url):
+    """Queue an outbound call without waiting on Plivo; returns its job id"""
+    job_id = uuid.uuid4().hex
+    # Background tasks run concurrently, up to MAX_CONCURRENT_CALLS at a time
+    app.add_background_task(_create_call, job_id, target_number, answer_url)
+    return job_id
+
+
+async def _create_call(job_id, target_number, answer_url):
+    """Background task: place a queued outbound call through Plivo"""
+    try:
+        # Cap concurrent Plivo requests so bulk dials don't trip rate limits
+        async with _CALL_SLOTS:
+            response = await PLIVO_CLIENT.post('Call/', json={
+                'from': CFG.plivo_phone,
+                'to': target_number,
+                'answer_url': answer_url,
+                'answer_method': 'GET'
+            })
+        response.raise_for_status()
+        request_uuid = response.json().get('request_uuid')
+    except asyncio.CancelledError:
+        app.logger.error(
+            'Call %s to %s cancelled at shutdown; it may not have been placed',
+            job_id, target_number
+        )
+        raise
+    except httpx.HTTPStatusError as e:
+        app.logger.error(
+            'Call %s to %s failed: Plivo API error %s: %s',
+            job_id, target_number, e.response.status_code, e.response.text
+        )
+    except Exception:
+        app.logger.exception('Call %s to %s failed', job_id, target_number)
+    else:
+        app.logger.info('Call %s to %s initiated: %s', job_id, target_number, request_uuid)
+
+
+@app.after_serving
+async def _close_plivo_client():
+    """Close pooled Plivo connections once queued calls have finished"""
+    if PLIVO_CLIENT is not None:
+        await PLIVO_CLIENT.aclose()
 
 
 # =============================================================================
@@ -149,80 +450,40 @@ def make_call():
 # =============================================================================
 
 @app.route('/ivr/welcome', methods=['GET', 'POST'])
-def ivr_welcome():
+async def ivr_welcome():
     """
     Level 1: Welcome message and language selection menu.
     - Press 1 for English
     - Press 2 for Spanish
     """
-    response = plivoxml.ResponseElement()
-    
-    # Create GetDigits element to capture language choice
-    get_digits = plivoxml.GetDigitsElement(
-        action=url_for('ivr_language_handler', _external=True),
-        method='POST',
-        timeout=10,
-        num_digits=1,
-        retries=2,
-        valid_digits='12'
-    )
-    
-    # Add welcome message and language options
-    get_digits.add_speak(
-        content=MESSAGES['welcome']['english'] + MESSAGES['language_select'],
-        voice='Polly.Joanna',
-        language='en-US'
+    return _xml_response(
+        ('welcome', 'english'),
+        _callback_url(LANGUAGE_HANDLER_PATH)
     )
-    
-    response.add(get_digits)
-    
-    # Fallback if no input received
-    response.add_speak(
-        content=MESSAGES['no_input']['english'] + " " + MESSAGES['goodbye']['english'],
-        voice='Polly.Joanna',
-        language='en-US'
-    )
-    response.add_hangup()
-    
-    return Response(response.to_string(), mimetype='text/xml')
 
 
 @app.route('/ivr/language-handler', methods=['POST'])
-def ivr_language_handler():
+async def ivr_language_handler():
     """
     Handle the language selection input from Level 1.
-    Routes to appropriate Level 2 menu based on selection.
+    Serves the selected Level 2 menu directly, rather than redirecting,
+    so Plivo saves a round trip.
     """
-    response = plivoxml.ResponseElement()
-    
     # Get the digit pressed
-    digit = request.form.get('Digits', '')
+    digit = await _read_digits()
     
-    if digit == '1':
-        # English selected - redirect to English main menu
-        response.add_redirect(
-            url_for('ivr_main_menu', lang='english', _external=True),
-            method='GET'
-        )
-    elif digit == '2':
-        # Spanish selected - redirect to Spanish main menu
-        response.add_redirect(
-            url_for('ivr_main_menu', lang='spanish', _external=True),
-            method='GET'
-        )
-    else:
-        # Invalid input - repeat language selection
-        response.add_speak(
-            content=MESSAGES['invalid_input']['english'],
-            voice='Polly.Joanna',
-            language='en-US'
-        )
-        response.add_redirect(
-            url_for('ivr_welcome', _external=True),
-            method='GET'
+    lang = LANGUAGE_DIGITS.get(digit)
+    if lang is not None:
+        return _xml_response(
+            ('main_menu', lang),
+            _callback_url(MENU_HANDLER_PATH, lang=lang)
         )
     
-    return Response(response.to_string(), mimetype='text/xml')
+    # Invalid input - repeat language selection
+    return _xml_response(
+        ('invalid_input', 'english'),
+        _callback_url(WELCOME_PATH)
+    )
 
 
 # =============================================================================
@@ -230,124 +491,63 @@ def ivr_language_handler():
 # =============================================================================
 
 @app.route('/ivr/main-menu/<lang>', methods=['GET', 'POST'])
-def ivr_main_menu(lang):
+async def ivr_main_menu(lang):
     """
     Level 2: Main menu in selected language.
     - Press 1 to play audio message
     - Press 2 to connect to live associate
     """
     # Validate language
-    if lang not in ['english', 'spanish']:
+    if lang not in VALID_LANGS:
         lang = 'english'
     
-    # Set voice based on language
-    voice = 'Polly.Joanna' if lang == 'english' else 'Polly.Conchita'
-    voice_lang = 'en-US' if lang == 'english' else 'es-ES'
-    
-    response = plivoxml.ResponseElement()
-    
-    # Create GetDigits element for menu selection
-    get_digits = plivoxml.GetDigitsElement(
-        action=url_for('ivr_menu_handler', lang=lang, _external=True),
-        method='POST',
-        timeout=10,
-        num_digits=1,
-        retries=2,
-        valid_digits='12'
+    return _xml_response(
+        ('main_menu', lang),
+        _callback_url(MENU_HANDLER_PATH, lang=lang)
     )
-    
-    # Add main menu message
-    get_digits.add_speak(
-        content=MESSAGES['main_menu'][lang],
-        voice=voice,
-        language=voice_lang
-    )
-    
-    response.add(get_digits)
-    
-    # Fallback if no input received
-    response.add_speak(
-        content=MESSAGES['no_input'][lang] + " " + MESSAGES['goodbye'][lang],
-        voice=voice,
-        language=voice_lang
+
+
+def _play_audio_response(lang):
+    """Menu option 1: play the audio message, then hang up"""
+    return _xml_response(('play_audio', lang))
+
+
+def _connect_associate_response(lang):
+    """Menu option 2: forward the caller to a live associate"""
+    return _xml_response(('connect_associate', lang))
+
+
+def _invalid_response(lang):
+    """Invalid input: apologise and repeat the main menu"""
+    return _xml_response(
+        ('invalid_input', lang),
+        _callback_url(MAIN_MENU_PATH, lang=lang)
     )
-    response.add_hangup()
-    
-    return Response(response.to_string(), mimetype='text/xml')
+
+
+# Main menu digit -> response builder
+MENU_HANDLERS = {
+    '1': _play_audio_response,
+    '2': _connect_associate_response
+}
 
 
 @app.route('/ivr/menu-handler/<lang>', methods=['POST'])
-def ivr_menu_handler(lang):
+async def ivr_menu_handler(lang):
     """
     Handle the main menu selection from Level 2.
     - 1: Play audio message
     - 2: Connect to live associate
     """
     # Validate language
-    if lang not in ['english', 'spanish']:
+    if lang not in VALID_LANGS:
         lang = 'english'
     
-    # Set voice based on language
-    voice = 'Polly.Joanna' if lang == 'english' else 'Polly.Conchita'
-    voice_lang = 'en-US' if lang == 'english' else 'es-ES'
-    
-    response = plivoxml.ResponseElement()
-    
     # Get the digit pressed
-    digit = request.form.get('Digits', '')
-    
-    if digit == '1':
-        # Play audio message
-        response.add_speak(
-            content=MESSAGES['playing_audio'][lang],
-            voice=voice,
-            language=voice_lang
-        )
-        response.add_play(AUDIO_FILES[lang])
-        response.add_speak(
-            content=MESSAGES['goodbye'][lang],
-            voice=voice,
-            language=voice_lang
-        )
-        response.add_hangup()
-        
-    elif digit == '2':
-        # Connect to live associate
-        response.add_speak(
-            content=MESSAGES['connecting'][lang],
-            voice=voice,
-            language=voice_lang
-        )
-        
-        # Dial the associate number
-        dial = plivoxml.DialElement(
-            caller_id=PLIVO_PHONE_NUMBER,
-            timeout=30
-        )
-        dial.add_number(ASSOCIATE_NUMBER)
-        response.add(dial)
-        
-        # If call fails or ends
-        response.add_speak(
-            content=MESSAGES['goodbye'][lang],
-            voice=voice,
-            language=voice_lang
-        )
-        response.add_hangup()
-        
-    else:
-        # Invalid input - repeat main menu
-        response.add_speak(
-            content=MESSAGES['invalid_input'][lang],
-            voice=voice,
-            language=voice_lang
-        )
-        response.add_redirect(
-            url_for('ivr_main_menu', lang=lang, _external=True),
-            method='GET'
-        )
+    digit = await _read_digits()
     
-    return Response(response.to_string(), mimetype='text/xml')
+    # Dispatch on the digit pressed
+    return MENU_HANDLERS.get(digit, _invalid_response)(lang)
 
 
 # =============================================================================
@@ -355,9 +555,9 @@ def ivr_menu_handler(lang):
 # =============================================================================
 
 @app.route('/health', methods=['GET'])
-def health_check():
+async def health_check():
     """Health check endpoint"""
-    return jsonify({
+    return _json({
         'status': 'healthy',
         'service': 'InspireWorks IVR Demo'
     })
@@ -371,11 +571,13 @@ if __name__ == '__main__':
     print("\n" + "="*60)
     print("  InspireWorks IVR Demo System")
     print("="*60)
-    print(f"  Plivo Phone Number: {PLIVO_PHONE_NUMBER}")
-    print(f"  Associate Number:   {ASSOCIATE_NUMBER}")
+    print(f"  Plivo Phone Number: {CFG.plivo_phone}")
+    print(f"  Associate Number:   {CFG.associate}")
     print("="*60)
     print("  Starting server on http://localhost:5000")
     print("  Use ngrok to expose: ngrok http 5000")
     print("="*60 + "\n")
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    # Development server only; production runs under Uvicorn (see Procfile).
+    # Debug mode (reloader, debugger) is opt-in via QUART_DEBUG=1
+    app.run(host='0.0.0.0', port=5000, debug=os.getenv('QUART_DEBUG') == '1')
\ No newline at end of file